@@ -0,0 +1,108 @@
+"""
+Field Cache - Persist discovered Jira field IDs
+
+Field discovery (GET /rest/api/3/field, editmeta fallback) is slow and its
+result rarely changes, so the field IDs it resolves are cached on disk per
+Jira instance and reused until they expire.
+"""
+
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.jira_tool_cache')
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_VERSION = 1
+
+
+def _cache_path(base_url: str) -> str:
+    """
+    Get the cache file path for a Jira instance.
+    
+    Args:
+        base_url: Jira instance URL
+    
+    Returns:
+        str: Path to the cache file
+    """
+    digest = hashlib.sha256(base_url.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f'fields-{digest}.json')
+
+
+def refresh_requested() -> bool:
+    """
+    Check whether the user asked to ignore cached field mappings.
+    
+    Returns:
+        bool: True if JIRA_TOOL_REFRESH_FIELDS is set to 1/true/yes
+    """
+    return os.getenv('JIRA_TOOL_REFRESH_FIELDS', '').strip().lower() in ('1', 'true', 'yes')
+
+
+@lru_cache(maxsize=None)
+def load(base_url: str) -> Optional[Dict[str, str]]:
+    """
+    Load the cached field mapping for a Jira instance (memoized per process).
+    
+    Args:
+        base_url: Jira instance URL
+    
+    Returns:
+        Optional[Dict[str, str]]: Lowercase field name -> field ID, or None if
+        there is no usable cache (missing, expired, unreadable or refresh requested)
+    """
+    if refresh_requested():
+        return None
+    
+    cache_file = _cache_path(base_url)
+    if not os.path.exists(cache_file):
+        return None
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            envelope = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring field cache {cache_file}: {e}")
+        return None
+    
+    if not isinstance(envelope, dict) or envelope.get('version') != CACHE_VERSION:
+        return None
+    if envelope.get('base_url') != base_url:
+        return None
+    if time.time() - envelope.get('timestamp', 0) > CACHE_TTL_SECONDS:
+        return None
+    
+    fields = envelope.get('fields')
+    return fields if isinstance(fields, dict) else None
+
+
+def save(base_url: str, mapping: Dict[str, str]):
+    """
+    Persist the field mapping for a Jira instance.
+    
+    Args:
+        base_url: Jira instance URL
+        mapping: Lowercase field name -> field ID ('name@PROJECT' for
+            fields only known to be valid in one project)
+    """
+    envelope = {
+        'version': CACHE_VERSION,
+        'timestamp': time.time(),
+        'base_url': base_url,
+        'fields': mapping
+    }
+    
+    cache_file = _cache_path(base_url)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(envelope, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"⚠️  Could not save field cache {cache_file}: {e}")
+    
+    # Later loads in this process must see the new mapping
+    load.cache_clear()
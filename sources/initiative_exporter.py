@@ -5,17 +5,71 @@ This module exports Initiative issues from a Jira project to a JSON file.
 Includes issue key, description, requester, and linked issue count.
 """
 
+import itertools
 import json
-from typing import List, Dict, Optional
+import os
+from typing import Iterable, Iterator, List, Dict, Optional, TextIO
 from datetime import datetime
 
 from jira_client import JiraClient
 
 
+# Encoders are built once and reused for every record (json.dumps with
+# keyword arguments constructs a new JSONEncoder on each call)
+_JSON_ARRAY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_JSON_LINES_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Shared read-only default for missing nested objects (never mutated)
+_EMPTY: Dict = {}
+
+# Marks ADF nodes without a 'text' key (distinct from an empty or null text)
+_NO_TEXT = object()
+
+
+def iter_initiatives(jira: JiraClient, project_key: str) -> Iterator[Dict]:
+    """
+    Yield Initiative issues from a project that are not DONE or CANCELED,
+    page by page as they are fetched (nextPageToken via JiraClient.search_pages).
+    
+    Args:
+        jira: Authenticated Jira client instance
+        project_key: Project key to search
+        
+    Yields:
+        Dict: Initiative issues with required fields
+    """
+    print(f"\n🔍 Fetching Initiatives from project {project_key}...")
+    
+    # JQL to find Initiatives that are not DONE or CANCELED
+    jql = f'project = {project_key} AND issuetype = Initiative AND status NOT IN (DONE, CANCELED)'
+    
+    issue_count = 0
+    page_num = 0
+    
+    # Pages are yielded as soon as they arrive (token-based pagination)
+    # Only the fields read by format_initiative_data; issuelinks already carry
+    # the linked issue's key, summary and issuetype without any expand
+    for page_issues in jira.search_pages(
+        jql,
+        fields=['description', 'reporter', 'issuelinks', 'fixVersions', 'versions']
+    ):
+        page_num += 1
+        issue_count += len(page_issues)
+        print(f"  Fetched page {page_num}: {len(page_issues)} issues")
+        
+        # Hand issues over one at a time, dropping the page's reference to
+        # each so it can be freed once formatted rather than with the page
+        page_issues.reverse()
+        while page_issues:
+            yield page_issues.pop()
+    
+    print(f"✓ Found {issue_count} Initiative(s) across {page_num} page(s)")
+
+
 def get_initiatives(jira: JiraClient, project_key: str) -> List[Dict]:
     """
     Get all Initiative issues from a project that are not DONE or CANCELED.
-    Handles pagination using nextPageToken (max 100 results per page).
+    Handles pagination using nextPageToken via JiraClient.search_pages.
     
     Args:
         jira: Authenticated Jira client instance
@@ -24,57 +78,8 @@ def get_initiatives(jira: JiraClient, project_key: str) -> List[Dict]:
     Returns:
         List[Dict]: List of Initiative issues with required fields
     """
-    print(f"\n🔍 Fetching Initiatives from project {project_key}...")
-    
     try:
-        # JQL to find Initiatives that are not DONE or CANCELED
-        jql = f'project = {project_key} AND issuetype = Initiative AND status NOT IN (DONE, CANCELED)'
-        
-        all_issues = []
-        next_page_token = None
-        page_num = 1
-        
-        # Fetch all pages using token-based pagination
-        while True:
-            print(f"  Fetching page {page_num}...", end='')
-            
-            # Build request data
-            request_data = {
-                'jql': jql,
-                'maxResults': 100,  # API limit per page
-                'fields': ['summary', 'description', 'reporter', 'issuelinks', 'fixVersions', 'versions'],
-                'expand': 'issuelinks'  # Expand to get linked issue details
-            }
-            
-            # Add nextPageToken if this is not the first page
-            if next_page_token:
-                request_data['nextPageToken'] = next_page_token
-            
-            # Fetch page
-            result = jira.post('rest/api/3/search/jql', data=request_data)
-            
-            # Collect issues from this page
-            page_issues = result.get('issues', [])
-            all_issues.extend(page_issues)
-            print(f" {len(page_issues)} issues")
-            
-            # Check if this is the last page
-            is_last = result.get('isLast', True)
-            if is_last:
-                break
-            
-            # Get token for next page
-            next_page_token = result.get('nextPageToken')
-            if not next_page_token:
-                # No token but not last page - shouldn't happen, but break to be safe
-                print("  ⚠️  Warning: No nextPageToken but isLast is False")
-                break
-            
-            page_num += 1
-        
-        print(f"✓ Found {len(all_issues)} Initiative(s) across {page_num} page(s)")
-        
-        return all_issues
+        return list(iter_initiatives(jira, project_key))
     except Exception as e:
         print(f"❌ Error fetching Initiatives: {e}")
         return []
@@ -118,20 +123,22 @@ def format_initiative_data(issue: Dict) -> Dict:
     issue_links = fields.get('issuelinks', [])
     linked_issues_count = len(issue_links)
     
-    # Extract linked issue details
+    # Extract linked issue details (locals and a shared empty dict keep the
+    # per-link work down to plain dict lookups)
     linked_issues_details = []
+    append_detail = linked_issues_details.append
     for link in issue_links:
         # Linked issue can be inward or outward
         linked_issue = link.get('inwardIssue') or link.get('outwardIssue')
-        if linked_issue:
-            linked_fields = linked_issue.get('fields', {})
-            issue_type = linked_fields.get('issuetype', {})
-            
-            linked_issues_details.append({
-                'key': linked_issue.get('key', ''),
-                'summary': linked_fields.get('summary', ''),
-                'issueType': issue_type.get('name', '')
-            })
+        if not linked_issue:
+            continue
+        linked_fields = linked_issue.get('fields') or _EMPTY
+        issue_type = linked_fields.get('issuetype') or _EMPTY
+        append_detail({
+            'key': linked_issue.get('key', ''),
+            'summary': linked_fields.get('summary', ''),
+            'issueType': issue_type.get('name', '')
+        })
     
     # Get fix versions
     fix_versions = fields.get('fixVersions', [])
@@ -152,6 +159,20 @@ def format_initiative_data(issue: Dict) -> Dict:
     }
 
 
+def format_initiatives(issues: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Format Initiative issues for export, preserving their order.
+    
+    Args:
+        issues: Raw Jira issue dictionaries
+        
+    Yields:
+        Dict: Formatted issue data, in input order
+    """
+    for issue in issues:
+        yield format_initiative_data(issue)
+
+
 def extract_text_from_adf(adf: Dict) -> str:
     """
     Extract plain text from Atlassian Document Format (ADF).
@@ -162,51 +183,113 @@ def extract_text_from_adf(adf: Dict) -> str:
     Returns:
         str: Extracted plain text
     """
-    def extract_from_node(node):
+    # Iterative depth-first walk: collect every text fragment once and join at
+    # the end instead of recursing and joining at each level of the tree
+    texts = []
+    stack = [adf]
+    # Local aliases: the loop runs once per node
+    append_text = texts.append
+    pop_node = stack.pop
+    push_nodes = stack.extend
+    no_text = _NO_TEXT
+    while stack:
+        node = pop_node()
         if not isinstance(node, dict):
-            return ""
-        
-        # If node has text, return it
-        if 'text' in node:
-            return node['text']
+            continue
         
-        # If node has content, recursively extract from children
-        content = node.get('content', [])
-        texts = []
-        for child in content:
-            text = extract_from_node(child)
+        # Most ADF nodes are text leaves: one lookup both detects and reads
+        # the text (text nodes have no children to visit)
+        text = node.get('text', no_text)
+        if text is not no_text:
             if text:
-                texts.append(text)
+                append_text(text)
+            continue
         
-        return ' '.join(texts)
+        # If node has content, visit children left to right
+        content = node.get('content')
+        if content:
+            push_nodes(reversed(content))
     
-    return extract_from_node(adf).strip()
+    return ' '.join(texts).strip()
+
+
+def write_json_array(f: TextIO, records: Iterable[Dict]) -> int:
+    """
+    Write records as a JSON array, one record at a time.
+    
+    Produces the same layout as json.dump(records, f, indent=2, ensure_ascii=False)
+    without holding all records in memory.
+    
+    Args:
+        f: Text file opened for writing
+        records: Records to serialize
+        
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    for record in records:
+        f.write('[\n' if count == 0 else ',\n')
+        # Nest the record one level inside the array (JSON output has no blank lines)
+        f.write('  ' + _JSON_ARRAY_ENCODER.encode(record).replace('\n', '\n  '))
+        count += 1
+    f.write('\n]' if count else '[]')
+    return count
+
+
+def write_json_lines(f: TextIO, records: Iterable[Dict]) -> int:
+    """
+    Write records as JSON Lines (one compact JSON object per line).
+    
+    Args:
+        f: Text file opened for writing
+        records: Records to serialize
+        
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    for record in records:
+        f.write(_JSON_LINES_ENCODER.encode(record))
+        f.write('\n')
+        count += 1
+    return count
 
 
 def export_initiatives_to_json(jira: JiraClient, project_key: str, output_file: Optional[str] = None) -> str:
     """
     Export Initiatives to a JSON file.
     
+    Issues are formatted and written as pages arrive from Jira, so neither the
+    raw issues nor the formatted records are all held in memory at once.
+    
     Args:
         jira: Authenticated Jira client instance
         project_key: Project key to export from
-        output_file: Optional output filename (defaults to initiatives_{project_key}_{timestamp}.json)
+        output_file: Optional output filename (defaults to initiatives_{project_key}_{timestamp}.json).
+            A name ending in .jsonl is written as JSON Lines instead of a JSON array.
         
     Returns:
         str: Path to the created JSON file
     """
     # Get initiatives
-    issues = get_initiatives(jira, project_key)
+    issues = iter_initiatives(jira, project_key)
+    try:
+        first_issue = next(issues, None)
+    except Exception as e:
+        print(f"❌ Error fetching Initiatives: {e}")
+        return ""
     
-    if not issues:
+    if first_issue is None:
         print("⚠️  No Initiatives found to export.")
         return ""
     
-    # Format data
+    # Format data lazily, as the writer consumes it
     print(f"\n📝 Formatting Initiative data...")
-    formatted_data = []
-    for issue in issues:
-        formatted_data.append(format_initiative_data(issue))
+    # chain() keeps its arguments until the end: pass an iterator, which lets
+    # go of the first issue once consumed, and drop the local reference too
+    formatted_data = format_initiatives(itertools.chain(iter([first_issue]), issues))
+    del first_issue
     
     # Generate filename if not provided
     if not output_file:
@@ -216,13 +299,19 @@ def export_initiatives_to_json(jira: JiraClient, project_key: str, output_file:
     # Write to JSON file
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(formatted_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n✓ Successfully exported {len(formatted_data)} Initiative(s) to: {output_file}")
-        return output_file
+            if output_file.endswith('.jsonl'):
+                count = write_json_lines(f, formatted_data)
+            else:
+                count = write_json_array(f, formatted_data)
     except Exception as e:
-        print(f"\n❌ Error writing JSON file: {e}")
+        print(f"\n❌ Error exporting Initiatives to {output_file}: {e}")
+        # Don't leave a truncated export behind
+        if os.path.exists(output_file):
+            os.remove(output_file)
         return ""
+    
+    print(f"\n✓ Successfully exported {count} Initiative(s) to: {output_file}")
+    return output_file
 
 
 def run_initiative_exporter(jira: JiraClient, project_key: str):
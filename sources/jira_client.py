@@ -5,17 +5,80 @@ This module provides a lightweight client for interacting with Jira Cloud REST A
 Uses requests library with session-based authentication.
 """
 
+import base64
+import json
 import os
-from typing import Dict, Optional
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    # Optional: faster decoding of large search pages when installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Largest page /rest/api/3/search/jql accepts. Jira Cloud returns fewer issues
+# per page when many fields are requested, so asking for the maximum lets the
+# server pick the biggest page it can serve instead of a fixed 100.
+SEARCH_MAX_RESULTS = 5000
+
+# Pages a search may fetch ahead of the caller (bounds memory use)
+SEARCH_PREFETCH_PAGES = 2
+
+# Lifetime of cached GET responses when JIRA_ENABLE_CACHE is set
+GET_CACHE_TTL_SECONDS = 300
+
+# Upper bound for a single retry backoff sleep
+RETRY_BACKOFF_MAX_SECONDS = 30
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with random jitter added to the exponential backoff.
+    
+    When a Retry-After header is present (429/503), urllib3 waits for that
+    instead. Jitter keeps concurrent requests that were throttled together
+    from all retrying at the same instant.
+    """
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return min(backoff + random.uniform(0, self.backoff_factor), RETRY_BACKOFF_MAX_SECONDS)
+
+
+class PrecomputedBasicAuth(AuthBase):
+    """
+    HTTP Basic auth with the Authorization header encoded once.
+    
+    requests.auth.HTTPBasicAuth re-encodes the credentials on every request.
+    Keeping an auth object on the session (rather than a bare header) also
+    stops requests from looking up ~/.netrc for each request.
+    """
+    
+    def __init__(self, email: str, api_token: str):
+        credentials = base64.b64encode(f"{email}:{api_token}".encode('utf-8')).decode('ascii')
+        self.header = f'Basic {credentials}'
+    
+    def __call__(self, request):
+        request.headers['Authorization'] = self.header
+        return request
+
 
 class JiraClient:
     """Simple Jira Cloud REST API v3 client."""
     
-    def __init__(self, url: str, email: str, api_token: str):
+    def __init__(self, url: str, email: str, api_token: str, cache_ttl: Optional[float] = None):
         """
         Initialize Jira client.
         
@@ -23,20 +86,73 @@ class JiraClient:
             url: Jira instance URL (e.g., https://yourcompany.atlassian.net)
             email: Jira user email
             api_token: Jira API token
+            cache_ttl: Optional lifetime in seconds of cached GET responses
+                (None disables caching)
         """
         self.base_url = url.rstrip('/')
-        self.auth = HTTPBasicAuth(email, api_token)
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # Project list fetched by from_env's connection test, handed to the
+        # first project listing so it doesn't fetch the same data again
+        self.initial_projects: Optional[List[Dict]] = None
+        self.auth = PrecomputedBasicAuth(email, api_token)
         self.session = requests.Session()
         self.session.auth = self.auth
         self.session.headers.update({
             'Accept': 'application/json',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
+        
+        # Pooled adapter so every call reuses the same kept-alive HTTPS
+        # connections instead of paying a new TLS handshake per request
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=64,
+            max_retries=JitteredRetry(
+                total=8,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST', 'PUT']),
+                respect_retry_after_header=True,  # Rate limits (429) tell us how long to wait
+                raise_on_status=False  # Hand the last response back to raise_for_status()
+            )
+        )
+        # Same pool and retries for plain-HTTP (e.g. internal Data Center) instances
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """
+        Decode a JSON response body.
+        
+        Parses the raw bytes directly (json.loads detects UTF-8 itself),
+        skipping the text decoding step of response.json(), and uses orjson
+        instead when it is installed. Empty bodies, such as 204 No Content
+        from issue updates, give an empty dict.
+        
+        Args:
+            response: Successful HTTP response
+            
+        Returns:
+            Decoded JSON (dictionary or list)
+        """
+        content = response.content
+        if not content:
+            return {}
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
     
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
         Make a GET request to Jira API.
         
+        When caching is enabled (cache_ttl), successful responses are reused
+        for identical requests until they expire. Callers must not modify
+        the returned object.
+        
         Args:
             endpoint: API endpoint (without base URL)
             params: Optional query parameters
@@ -45,9 +161,20 @@ class JiraClient:
             JSON response as dictionary
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        
+        if self.cache_ttl:
+            cache_key = (url, repr(sorted(params.items())) if params else '')
+            cached = self._get_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+        
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        result = self._parse_json(response)
+        
+        if self.cache_ttl:
+            self._get_cache[cache_key] = (time.monotonic(), result)
+        return result
     
     def post(self, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """
@@ -70,7 +197,7 @@ class JiraClient:
             except:
                 print(f"API Error Response: {response.text}")
         response.raise_for_status()
-        return response.json()
+        return self._parse_json(response)
     
     def put(self, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """
@@ -86,7 +213,95 @@ class JiraClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         response = self.session.put(url, json=data)
         response.raise_for_status()
-        return response.json()
+        return self._parse_json(response)
+    
+    def search_pages(self, jql: str, fields: List[str], max_results: int = SEARCH_MAX_RESULTS,
+                     expand: Optional[str] = None,
+                     prefetch_pages: int = SEARCH_PREFETCH_PAGES) -> Iterator[List[Dict]]:
+        """
+        Search issues with JQL, yielding one page of issues at a time.
+        
+        Uses POST /rest/api/3/search/jql with token-based pagination
+        (nextPageToken). This endpoint does not report a total, so pages
+        cannot be fetched in parallel; instead a background thread keeps
+        fetching pages in order into a bounded queue while the caller
+        processes earlier ones.
+        
+        Args:
+            jql: JQL query (must be bounded, e.g. include a project restriction)
+            fields: List of fields to return for each issue
+            max_results: Maximum number of issues per page (the server may return fewer)
+            expand: Optional expand parameter
+            prefetch_pages: Maximum number of fetched pages waiting for the caller
+            
+        Yields:
+            List[Dict]: Issues of each page, in order
+        """
+        pages: queue.Queue = queue.Queue(maxsize=max(1, prefetch_pages))
+        stop = threading.Event()
+        
+        def hand_over(item: Tuple[str, Any]) -> bool:
+            # Block while the queue is full, unless the caller stopped iterating
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def fetch_pages():
+            try:
+                next_page_token = None
+                while True:
+                    request_data = {
+                        'jql': jql,
+                        'maxResults': max_results,
+                        'fields': fields
+                    }
+                    if expand:
+                        request_data['expand'] = expand
+                    # Add nextPageToken if this is not the first page
+                    if next_page_token:
+                        request_data['nextPageToken'] = next_page_token
+                    
+                    result = self.post('rest/api/3/search/jql', data=request_data)
+                    if not hand_over(('page', result.get('issues', []))):
+                        return
+                    
+                    # Check if this is the last page
+                    if result.get('isLast', True):
+                        break
+                    
+                    # Get token for next page
+                    next_page_token = result.get('nextPageToken')
+                    if not next_page_token:
+                        # No token but not last page - shouldn't happen, but stop to be safe
+                        print("  ⚠️  Warning: No nextPageToken but isLast is False")
+                        break
+            except Exception as e:
+                hand_over(('error', e))
+                return
+            hand_over(('done', None))
+        
+        fetcher = threading.Thread(target=fetch_pages, name='jira-search-pages', daemon=True)
+        fetcher.start()
+        try:
+            while True:
+                # Wait in short slices: an untimed get() can't be interrupted
+                # by Ctrl+C on Windows
+                try:
+                    kind, value = pages.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if kind == 'error':
+                    raise value
+                if kind == 'done':
+                    return
+                yield value
+        finally:
+            # Let the fetcher exit if the caller stops early
+            stop.set()
     
     @classmethod
     def from_env(cls) -> 'JiraClient':
@@ -94,13 +309,18 @@ class JiraClient:
         Create a JiraClient instance from environment variables.
         
         Loads credentials from .env file and establishes a connection to Jira.
-        Tests the connection by fetching the list of accessible projects.
+        Tests the connection by fetching the list of accessible projects,
+        which is kept in initial_projects for the first project listing.
         
         Environment variables required:
             JIRA_URL: Jira instance URL (e.g., https://yourcompany.atlassian.net)
             JIRA_EMAIL: Jira user email
             JIRA_API_TOKEN: Jira API token
         
+        Optional environment variables:
+            JIRA_ENABLE_CACHE: Set to 1/true/yes to cache GET responses for
+                GET_CACHE_TTL_SECONDS (project list, fields, versions, ...)
+        
         Returns:
             JiraClient: Authenticated and tested Jira client instance
             
@@ -119,12 +339,17 @@ class JiraClient:
         # Clean up URL
         jira_url = jira_url.strip().rstrip('/')
         
-        client = cls(jira_url, jira_email, jira_api_token)
+        enable_cache = os.getenv('JIRA_ENABLE_CACHE', '').strip().lower() in ('1', 'true', 'yes')
+        cache_ttl = GET_CACHE_TTL_SECONDS if enable_cache else None
+        
+        client = cls(jira_url, jira_email, jira_api_token, cache_ttl=cache_ttl)
         
         # Test connection by getting list of projects (works with scoped tokens)
         try:
             # Simple GET request to test authentication
             result = client.get('rest/api/3/project')
+            if isinstance(result, list):
+                client.initial_projects = result
             print(f"✓ Connected to Jira: {jira_url} (REST API v3)")
             print(f"✓ Authentication successful (scoped token)")
             if isinstance(result, list) and len(result) > 0:
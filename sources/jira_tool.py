@@ -8,23 +8,39 @@ This script provides multiple Jira management features:
 Uses Jira Cloud REST API v3 directly.
 """
 
-from typing import List, Dict
+import importlib
+import sys
+from functools import lru_cache
+from typing import Callable, List, Dict
 
 from jira_client import JiraClient
-from release_manager import run_release_manager
-from initiative_exporter import run_initiative_exporter
+from prompts import YES_ANSWERS, prompt
+
+
+# Number of projects shown per page when listing projects
+PROJECTS_PAGE_SIZE = 20
 
 
 def get_all_projects(jira: JiraClient) -> List[Dict]:
     """
     Get list of all accessible projects.
     
+    The list fetched by JiraClient.from_env's connection test is reused for
+    the first listing. Later listings are fetched again, unless the client's
+    GET cache is enabled (JIRA_ENABLE_CACHE).
+    
     Args:
         jira: Authenticated Jira client instance
         
     Returns:
         List of project dictionaries
     """
+    # Reuse the list fetched by the connection test, once
+    initial_projects = jira.initial_projects
+    if initial_projects is not None:
+        jira.initial_projects = None
+        return initial_projects
+    
     try:
         projects = jira.get('rest/api/3/project')
         return projects if isinstance(projects, list) else []
@@ -37,19 +53,34 @@ def list_projects_if_requested(jira: JiraClient):
     """
     Optionally list available projects if user requests.
     
+    Set JIRA_TOOL_LIST_PROJECTS (y/n) to answer without prompting.
+    
     Args:
         jira: Authenticated Jira client instance
     """
-    list_choice = input("\nDo you want to see a list of available projects? (y/n): ").strip().lower()
-    if list_choice == 'y':
+    list_choice = prompt("\nDo you want to see a list of available projects? (y/n): ",
+                         env='JIRA_TOOL_LIST_PROJECTS', default='n').lower()
+    if list_choice in YES_ANSWERS:
         print("\n📋 Fetching projects...")
         projects = get_all_projects(jira)
         if projects:
             print(f"\nFound {len(projects)} project(s):")
-            for proj in projects[:20]:  # Show first 20
-                print(f"  • {proj.get('key')}: {proj.get('name')}")
-            if len(projects) > 20:
-                print(f"  ... and {len(projects) - 20} more projects")
+            # Page through the list already in memory, no further requests
+            # (interactive terminals only)
+            for start in range(0, len(projects), PROJECTS_PAGE_SIZE):
+                for proj in projects[start:start + PROJECTS_PAGE_SIZE]:
+                    print(f"  • {proj.get('key')}: {proj.get('name')}")
+                remaining = len(projects) - start - PROJECTS_PAGE_SIZE
+                if remaining <= 0:
+                    break
+                if not sys.stdin.isatty():
+                    # Piped answers belong to the later prompts: don't consume one here
+                    print(f"  ... and {remaining} more projects")
+                    break
+                more_choice = prompt(f"  ... {remaining} more project(s). Show next {min(remaining, PROJECTS_PAGE_SIZE)}? (y/n): ",
+                                     default='y').lower()
+                if more_choice not in YES_ANSWERS:
+                    break
         else:
             print("No projects found or unable to fetch projects.")
 
@@ -58,13 +89,16 @@ def get_project_key_from_user(default_example: str = "PROJ") -> str:
     """
     Prompt user for project key.
     
+    Set JIRA_TOOL_PROJECT_KEY to answer without prompting.
+    
     Args:
         default_example: Example project key to show in prompt
         
     Returns:
         str: Project key entered by user (stripped), or empty string
     """
-    project_key = input(f"\nEnter your Jira project key (e.g., {default_example}): ").strip()
+    project_key = prompt(f"\nEnter your Jira project key (e.g., {default_example}): ",
+                         env='JIRA_TOOL_PROJECT_KEY')
     return project_key
 
 
@@ -84,6 +118,25 @@ def get_jira_client() -> JiraClient:
     return _jira_client
 
 
+@lru_cache(maxsize=None)
+def load_feature_runner(module_name: str, runner_name: str) -> Callable:
+    """
+    Import a feature module on first use and return its runner.
+    
+    Feature modules are only imported when their menu option is selected,
+    so starting the tool doesn't pay for features that are not used.
+    
+    Args:
+        module_name: Feature module in sources/ (e.g. 'release_manager')
+        runner_name: Runner function in that module (takes jira and project_key)
+        
+    Returns:
+        Callable: The feature runner
+    """
+    module = importlib.import_module(module_name)
+    return getattr(module, runner_name)
+
+
 def run_feature_workflow(feature_name: str, feature_runner, default_example: str = "PROJ"):
     """
     Run a feature workflow with common setup (header, project selection).
@@ -141,18 +194,20 @@ def main():
     """
     Main execution function.
     """
-    # Feature configuration: choice -> {name, description, runner, example_project}
+    # Feature configuration: choice -> {name, description, module, runner, example_project}
     features = {
         '1': {
             'name': 'Release Manager',
             'description': 'Find releases with only Bug issues',
-            'runner': run_release_manager,
+            'module': 'release_manager',
+            'runner': 'run_release_manager',
             'example': 'PROJ'
         },
         '2': {
             'name': 'Initiative Exporter',
             'description': 'Export Initiatives to JSON',
-            'runner': run_initiative_exporter,
+            'module': 'initiative_exporter',
+            'runner': 'run_initiative_exporter',
             'example': 'PMT'
         },
     }
@@ -162,14 +217,16 @@ def main():
     try:
         while True:
             display_menu(features)
-            choice = input(f"Select an option (1-{exit_choice}): ").strip()
+            # Exhausted input exits instead of failing
+            choice = prompt(f"Select an option (1-{exit_choice}): ", default=exit_choice)
             
             if choice == exit_choice:
                 print("\nGoodbye!")
                 break
             elif choice in features:
                 feature = features[choice]
-                run_feature_workflow(feature['name'], feature['runner'], feature['example'])
+                feature_runner = load_feature_runner(feature['module'], feature['runner'])
+                run_feature_workflow(feature['name'], feature_runner, feature['example'])
             else:
                 print(f"\n⚠️  Invalid option. Please select 1-{exit_choice}.")
         
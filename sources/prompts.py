@@ -0,0 +1,40 @@
+"""
+Prompts - Interactive questions that also work in scripted runs
+
+Answers can come from environment variables, from piped stdin, or from a
+default once stdin is exhausted, so the tool never dies on EOFError.
+"""
+
+import os
+from typing import Optional
+
+
+# Answers accepted as "yes" (prompts and environment overrides)
+YES_ANSWERS = ('y', 'yes', '1', 'true')
+
+
+def prompt(message: str, env: Optional[str] = None, default: str = '') -> str:
+    """
+    Ask the user a question, unless the answer is provided for scripted runs.
+    
+    An environment variable, when set, answers without prompting. Piped
+    answers are still read, and the default is used once stdin is
+    exhausted instead of failing.
+    
+    Args:
+        message: Prompt shown to the user
+        env: Optional environment variable holding the answer
+        default: Answer used when stdin has no more input
+        
+    Returns:
+        str: The answer (stripped)
+    """
+    if env:
+        value = os.environ.get(env)
+        if value is not None:
+            return value.strip()
+    
+    try:
+        return input(message).strip()
+    except EOFError:
+        return default
@@ -5,9 +5,94 @@ This module provides functionality to identify releases that contain only
 "Bug" or "Customer bug" issue types and update their Investment Category field.
 """
 
-from typing import List, Dict, Set, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Optional, Tuple
 
+import field_cache
 from jira_client import JiraClient
+from prompts import prompt
+
+
+# Issue types a release may contain to qualify
+ALLOWED_BUG_TYPES = frozenset(('Bug', 'Customer bug'))
+
+# Shared read-only default for missing nested objects (never mutated)
+_EMPTY: Dict = {}
+
+# Prefix of custom field IDs
+CUSTOM_FIELD_PREFIX = 'customfield_'
+
+# Editable custom fields of a project's sample issue: (base_url, project_key) -> {field_id: name}
+_project_custom_field_names: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+
+def get_editable_field_names(jira: JiraClient, issue_key: str) -> Dict[str, str]:
+    """
+    Map field IDs to names using an issue's edit metadata.
+    
+    Args:
+        jira: Authenticated Jira client instance
+        issue_key: Issue to read the edit metadata from
+        
+    Returns:
+        Dict[str, str]: Field ID -> field name
+    """
+    meta_response = jira.get(f'rest/api/3/issue/{issue_key}/editmeta')
+    fields_meta = meta_response.get('fields', {})
+    return {
+        field_id: field_info.get('name', '')
+        for field_id, field_info in fields_meta.items()
+    }
+
+
+def get_project_custom_field_names(jira: JiraClient, project_key: str) -> Optional[Dict[str, str]]:
+    """
+    Find the editable custom fields of a project from a sample issue.
+    
+    Fields present on one issue of a project are the same for the whole
+    project, so the result is cached per process.
+    
+    Args:
+        jira: Authenticated Jira client instance
+        project_key: Project key
+        
+    Returns:
+        Optional[Dict[str, str]]: Custom field ID -> name, or None if the project has no issues
+    """
+    cache_key = (jira.base_url, project_key)
+    if cache_key in _project_custom_field_names:
+        return _project_custom_field_names[cache_key]
+    
+    # Search for issues using JQL (POST required for /search/jql)
+    response = jira.post('rest/api/3/search/jql', data={
+        'jql': f'project = {project_key}',
+        'maxResults': 1,
+        # Only the issue key is needed: field names come from editmeta
+        'fields': ['issuetype']
+    })
+    
+    issues = response.get('issues', [])
+    if not issues:
+        return None
+    
+    issue = issues[0]
+    issue_key = issue.get('key')
+    print(f"  Examining issue: {issue_key}")
+    
+    # Get issue metadata to map field IDs to names
+    print(f"  Fetching edit metadata for field names...")
+    field_names_map = get_editable_field_names(jira, issue_key)
+    print(f"  Retrieved {len(field_names_map)} editable field names")
+    
+    custom_field_names = {}
+    cf_prefix = CUSTOM_FIELD_PREFIX
+    for field_id, field_name in field_names_map.items():
+        if field_name and field_id.startswith(cf_prefix):
+            custom_field_names[field_id] = field_name
+    
+    _project_custom_field_names[cache_key] = custom_field_names
+    return custom_field_names
 
 
 def get_investment_category_field_id(jira: JiraClient, project_key: str) -> str:
@@ -21,6 +106,18 @@ def get_investment_category_field_id(jira: JiraClient, project_key: str) -> str:
     Returns:
         str: The custom field ID (e.g., 'customfield_10001')
     """
+    # The field ID rarely changes: reuse the on-disk cache when it is fresh.
+    # Only the resolved ID is cached, so a cached run picks the same field as
+    # the discovery below. An ID found from a project's sample issue is only
+    # valid for that project (team-managed projects have their own custom
+    # fields), so it is cached under 'investment category@PROJECT'.
+    cached_field_ids = field_cache.load(jira.base_url) or {}
+    project_entry = f'investment category@{project_key}'
+    field_id = cached_field_ids.get('investment category') or cached_field_ids.get(project_entry)
+    if field_id:
+        print(f"✓ Found 'Investment Category' field (cached): {field_id}")
+        return field_id
+    
     # Get all fields using REST API v3
     all_fields = jira.get('rest/api/3/field')
     
@@ -28,34 +125,52 @@ def get_investment_category_field_id(jira: JiraClient, project_key: str) -> str:
         print(f"⚠️ Failed to retrieve fields from Jira API")
         all_fields = []
     
+    # Single pass: find the exact and case-insensitive matches and collect
+    # custom fields (first field wins on duplicate names)
+    exact_match = None
+    case_match = None
+    custom_fields = []
+    matching = []
+    for field in all_fields:
+        if not isinstance(field, dict) or not field.get('id'):
+            continue
+        name = field.get('name', '')
+        name_lower = name.lower()
+        if case_match is None and name_lower == 'investment category':
+            case_match = field
+        if exact_match is None and name == 'Investment Category':
+            exact_match = field
+        if field['id'].startswith(CUSTOM_FIELD_PREFIX):
+            custom_fields.append(field)
+            if 'invest' in name_lower or 'category' in name_lower:
+                matching.append(field)
+    
     print(f"📋 Searching through {len(all_fields)} fields...")
     
     # Debug: print field types
     if all_fields:
-        custom_count = sum(1 for f in all_fields if isinstance(f, dict) and f.get('id', '').startswith('customfield_'))
+        custom_count = len(custom_fields)
         system_count = len(all_fields) - custom_count
         print(f"   ({system_count} system fields, {custom_count} custom fields)")
     
     # First, try exact match
-    for field in all_fields:
-        if field.get('name') == 'Investment Category':
-            print(f"✓ Found 'Investment Category' field: {field['id']}")
-            return field['id']
+    if exact_match is not None:
+        print(f"✓ Found 'Investment Category' field: {exact_match['id']}")
+        field_cache.save(jira.base_url, {**cached_field_ids, 'investment category': exact_match['id']})
+        return exact_match['id']
     
-    # If not found, try case-insensitive search
-    for field in all_fields:
-        if field.get('name', '').lower() == 'investment category':
-            print(f"✓ Found 'Investment Category' field (case mismatch): {field['id']}")
-            return field['id']
+    # If not found, try case-insensitive match
+    if case_match is not None:
+        print(f"✓ Found 'Investment Category' field (case mismatch): {case_match['id']}")
+        field_cache.save(jira.base_url, {**cached_field_ids, 'investment category': case_match['id']})
+        return case_match['id']
     
     # If still not found, try partial match and show custom fields
     print("\n⚠️  Could not find 'Investment Category' field.")
     print("📋 Available custom fields:")
-    custom_fields = [f for f in all_fields if f.get('id', '').startswith('customfield_')]
     
     if custom_fields:
         print(f"  Found {len(custom_fields)} custom fields. Showing all that contain 'invest' or 'category':")
-        matching = [f for f in custom_fields if 'invest' in f.get('name', '').lower() or 'category' in f.get('name', '').lower()]
         if matching:
             for field in matching:
                 print(f"  ✓ {field.get('name')}: {field.get('id')}")
@@ -71,46 +186,19 @@ def get_investment_category_field_id(jira: JiraClient, project_key: str) -> str:
     # Try to get field from an actual issue
     print(f"\n🔍 Attempting to find field from a sample issue in {project_key}...")
     try:
-        # Search for issues using JQL (POST required for /search/jql)
-        response = jira.post('rest/api/3/search/jql', data={
-            'jql': f'project = {project_key}',
-            'maxResults': 1,
-            'fields': ['*all']
-        })
+        custom_field_names = get_project_custom_field_names(jira, project_key)
         
-        issues = response.get('issues', [])
-        if issues:
-            issue = issues[0]
-            issue_key = issue.get('key')
-            print(f"  Examining issue: {issue_key}")
-            
-            # Get raw fields
-            raw_fields = issue.get('fields', {})
-            print(f"  Found {len(raw_fields)} fields in issue")
-            
-            # Get issue metadata to map field IDs to names
-            print(f"  Fetching edit metadata for field names...")
-            meta_response = jira.get(f'rest/api/3/issue/{issue_key}/editmeta')
-            
-            field_names_map = {}
-            fields_meta = meta_response.get('fields', {})
-            for field_id, field_info in fields_meta.items():
-                field_names_map[field_id] = field_info.get('name', '')
-            
-            print(f"  Retrieved {len(field_names_map)} editable field names")
-            
+        if custom_field_names is not None:
             # Look for investment category
-            custom_fields_found = []
-            for field_id in raw_fields.keys():
-                if field_id.startswith('customfield_'):
-                    field_name = field_names_map.get(field_id, '')
-                    if field_name:
-                        custom_fields_found.append((field_id, field_name))
-                        if 'investment' in field_name.lower() and 'category' in field_name.lower():
-                            print(f"✓ Found via issue: '{field_name}' = {field_id}")
-                            return field_id
+            for field_id, field_name in custom_field_names.items():
+                if 'investment' in field_name.lower() and 'category' in field_name.lower():
+                    print(f"✓ Found via issue: '{field_name}' = {field_id}")
+                    # Remember it for this project only: it is missing from the field list
+                    field_cache.save(jira.base_url, {**cached_field_ids, project_entry: field_id})
+                    return field_id
             
             # Show custom fields found
+            custom_fields_found = list(custom_field_names.items())
             if custom_fields_found:
                 print(f"\n  📋 Found {len(custom_fields_found)} editable custom fields in issue:")
                 for fid, fname in custom_fields_found[:20]:
@@ -129,29 +217,92 @@ def get_investment_category_field_id(jira: JiraClient, project_key: str) -> str:
     raise ValueError("Could not find 'Investment Category' custom field")
 
 
-def get_all_releases(jira: JiraClient, project_key: str) -> List[Dict]:
+def fetch_releases(jira: JiraClient, project_key: str) -> Tuple[List[Dict], str]:
     """
-    Retrieve all releases (fixVersions) from Jira using REST API.
+    Retrieve all releases (fixVersions) from Jira without printing anything.
+    
+    Running Release Manager again on the same project reuses the releases
+    when the client's GET cache is enabled (JIRA_ENABLE_CACHE). The status
+    message is returned instead of printed so the fetch can run in the
+    background.
     
     Args:
         jira: Authenticated Jira client instance
         project_key: Project key to get releases for
         
     Returns:
-        List[Dict]: List of release information dictionaries
+        Tuple[List[Dict], str]: Releases and the status message to show
     """
     try:
         # Get releases for a specific project using REST API v3
-        releases = jira.get(f'rest/api/3/project/{project_key}/versions')
+        # (issuesstatus adds per-release issue counts, see release_issue_count)
+        releases = jira.get(f'rest/api/3/project/{project_key}/versions', params={'expand': 'issuesstatus'})
         if releases and isinstance(releases, list):
-            print(f"✓ Found {len(releases)} releases in project {project_key}")
-            return releases
+            return releases, f"✓ Found {len(releases)} releases in project {project_key}"
         else:
-            print(f"⚠️ No releases found for project {project_key}")
-            return []
+            return [], f"⚠️ No releases found for project {project_key}"
     except Exception as e:
-        print(f"❌ Error fetching releases: {e}")
-        return []
+        return [], f"❌ Error fetching releases: {e}"
+
+
+def get_all_releases(jira: JiraClient, project_key: str) -> List[Dict]:
+    """
+    Retrieve all releases (fixVersions) from Jira using REST API.
+    
+    Args:
+        jira: Authenticated Jira client instance
+        project_key: Project key to get releases for
+        
+    Returns:
+        List[Dict]: List of release information dictionaries
+    """
+    releases, message = fetch_releases(jira, project_key)
+    print(message)
+    return releases
+
+
+def release_issue_count(version: Dict) -> Optional[int]:
+    """
+    Count the issues of a release from its issuesstatus expansion.
+    
+    Args:
+        version: Release returned by get_all_releases
+        
+    Returns:
+        Optional[int]: Number of issues fixed in the release, or None if Jira
+        did not report the counts
+    """
+    status_counts = version.get('issuesStatusForFixVersion')
+    if not isinstance(status_counts, dict):
+        return None
+    return sum(count for count in status_counts.values() if isinstance(count, int))
+
+
+def _escape_jql_string(value: str) -> str:
+    """
+    Escape a value for use inside a double-quoted JQL string.
+    
+    Args:
+        value: Raw value (e.g. a release name)
+        
+    Returns:
+        str: Value with backslashes and double quotes escaped
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _release_jql(project_key: str, release_name: str) -> str:
+    """
+    Build the JQL clause selecting the issues of one release.
+    
+    Args:
+        project_key: Project key
+        release_name: Name of the release version
+        
+    Returns:
+        str: JQL query
+    """
+    return f'project = {project_key} AND fixVersion = "{_escape_jql_string(release_name)}"'
 
 
 def get_issues_in_release(jira: JiraClient, release_name: str, project_key: str) -> List[Dict]:
@@ -167,7 +318,7 @@ def get_issues_in_release(jira: JiraClient, release_name: str, project_key: str)
         List[Dict]: List of Jira issues in the release
     """
     try:
-        jql = f'project = {project_key} AND fixVersion = "{release_name}"'
+        jql = _release_jql(project_key, release_name)
         result = jira.post('rest/api/3/search/jql', data={
             'jql': jql,
             'maxResults': 1000,
@@ -179,21 +330,62 @@ def get_issues_in_release(jira: JiraClient, release_name: str, project_key: str)
         return []
 
 
-def check_release_has_only_bugs(jira: JiraClient, release_name: str, project_key: str) -> Dict:
+def _issuetype_name(issue: Dict) -> Optional[str]:
     """
-    Check if a release contains only "Bug" or "Customer bug" issue types.
+    Get the issue type name of a search result issue.
+    
+    Args:
+        issue: Issue from a search response
+        
+    Returns:
+        Optional[str]: Issue type name, or None if missing
+    """
+    fields = issue.get('fields') or _EMPTY
+    return (fields.get('issuetype') or _EMPTY).get('name')
+
+
+def get_release_issue_summaries(jira: JiraClient, project_key: str) -> Dict[str, Dict]:
+    """
+    Collect issue types and counts for every release of a project with a
+    single paginated JQL search, instead of one search per release.
     
     Args:
         jira: Authenticated Jira client instance
-        release_name: Name of the release version
         project_key: Project key
         
     Returns:
-        Dict: Dictionary with release info and whether it qualifies
+        Dict[str, Dict]: Release name -> {'issue_types': set, 'issue_count': int}
     """
-    issues = get_issues_in_release(jira, release_name, project_key)
+    jql = f'project = {project_key} AND fixVersion is not EMPTY'
+    summaries = {}
+    issuetype_name = _issuetype_name
     
-    if not issues:
+    for page_issues in jira.search_pages(jql, fields=['issuetype', 'fixVersions']):
+        for issue in page_issues:
+            issue_type = issuetype_name(issue)
+            # An issue counts towards every release it is fixed in
+            for version in (issue.get('fields') or _EMPTY).get('fixVersions') or ():
+                summary = summaries.setdefault(version.get('name', ''), {'issue_types': set(), 'issue_count': 0})
+                summary['issue_count'] += 1
+                if issue_type:
+                    summary['issue_types'].add(issue_type)
+    
+    return summaries
+
+
+def build_release_result(release_name: str, issue_types: Set[str], issue_count: int) -> Dict:
+    """
+    Decide whether a release contains only "Bug" or "Customer bug" issue types.
+    
+    Args:
+        release_name: Name of the release version
+        issue_types: Issue type names found in the release
+        issue_count: Number of issues in the release
+        
+    Returns:
+        Dict: Dictionary with release info and whether it qualifies
+    """
+    if not issue_count:
         return {
             'release': release_name,
             'qualifies': False,
@@ -202,53 +394,98 @@ def check_release_has_only_bugs(jira: JiraClient, release_name: str, project_key
             'issue_count': 0
         }
     
-    issue_types = set()
-    allowed_types = {'Bug', 'Customer bug'}
-    
-    for issue in issues:
-        issue_type = issue.get('fields', {}).get('issuetype', {}).get('name', '')
-        if issue_type:
-            issue_types.add(issue_type)
-    
-    qualifies = issue_types.issubset(allowed_types) and len(issue_types) > 0
+    qualifies = issue_types.issubset(ALLOWED_BUG_TYPES) and len(issue_types) > 0
     
     return {
         'release': release_name,
         'qualifies': qualifies,
-        'reason': 'Only bugs' if qualifies else f'Contains other issue types: {issue_types - allowed_types}',
+        'reason': 'Only bugs' if qualifies else f'Contains other issue types: {issue_types - ALLOWED_BUG_TYPES}',
         'issue_types': issue_types,
-        'issue_count': len(issues)
+        'issue_count': issue_count
     }
 
 
-def find_qualifying_releases(jira: JiraClient, project_key: str) -> List[Dict]:
+def check_release_has_only_bugs(jira: JiraClient, release_name: str, project_key: str) -> Dict:
+    """
+    Check if a release contains only "Bug" or "Customer bug" issue types.
+    
+    Searches a single release; find_qualifying_releases analyzes all
+    releases at once with get_release_issue_summaries.
+    
+    Args:
+        jira: Authenticated Jira client instance
+        release_name: Name of the release version
+        project_key: Project key
+        
+    Returns:
+        Dict: Dictionary with release info and whether it qualifies
+    """
+    issues = get_issues_in_release(jira, release_name, project_key)
+    
+    issue_types = set()
+    for issue in issues:
+        issue_type = _issuetype_name(issue)
+        if issue_type:
+            issue_types.add(issue_type)
+    
+    return build_release_result(release_name, issue_types, len(issues))
+
+
+def find_qualifying_releases(jira: JiraClient, project_key: str,
+                             releases: Optional[List[Dict]] = None,
+                             verbose: bool = False) -> List[Dict]:
     """
     Find all releases that contain only Bug or Customer bug issues.
     
     Args:
         jira: Authenticated Jira client instance
         project_key: Project key to search
+        releases: Releases if already fetched (fetched here with get_all_releases if None)
+        verbose: Print one line per release (written in a single batch)
         
     Returns:
         List[Dict]: List of qualifying releases with details
     """
     print(f"\n🔍 Analyzing releases in project {project_key}...")
     
-    versions = get_all_releases(jira, project_key)
+    versions = get_all_releases(jira, project_key) if releases is None else releases
     qualifying_releases = []
+    lines = []
+    
+    # Releases Jira reports as empty can't qualify: no need to search for them
+    needs_search = any(
+        release_issue_count(version) != 0
+        for version in versions
+        if version.get('name')
+    )
+    
+    # One search for all releases, grouped by fixVersion
+    try:
+        summaries = get_release_issue_summaries(jira, project_key) if needs_search else {}
+    except Exception as e:
+        print(f"Error fetching issues for releases: {e}")
+        summaries = {}
     
     for version in versions:
         version_name = version.get('name', '')
         if not version_name:
             continue
-            
-        result = check_release_has_only_bugs(jira, version_name, project_key)
+        
+        summary = summaries.get(version_name)
+        if summary:
+            result = build_release_result(version_name, summary['issue_types'], summary['issue_count'])
+        else:
+            result = build_release_result(version_name, set(), 0)
         
         if result['qualifies']:
             qualifying_releases.append(result)
-            print(f"  ✓ {result['release']}: {result['issue_count']} issues - {result['issue_types']}")
-        else:
-            print(f"  ✗ {result['release']}: {result['reason']}")
+            if verbose:
+                lines.append(f"  ✓ {result['release']}: {result['issue_count']} issues - {result['issue_types']}")
+        elif verbose:
+            lines.append(f"  ✗ {result['release']}: {result['reason']}")
+    
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     return qualifying_releases
 
@@ -261,21 +498,30 @@ def run_release_manager(jira: JiraClient, project_key: str):
         jira: Authenticated Jira client instance
         project_key: Project key to analyze
     """
-    # Get the Investment Category field ID
-    try:
-        investment_category_field = get_investment_category_field_id(jira, project_key)
-    except ValueError as e:
-        print(f"\n⚠️  {str(e)}")
-        manual_field = input("\nDo you know the custom field ID? Enter it (e.g., customfield_10001) or press Enter to skip: ").strip()
-        if manual_field:
-            investment_category_field = manual_field
-            print(f"✓ Using custom field: {investment_category_field}")
-        else:
-            print("⚠️  Continuing without custom field ID (will find releases only)")
-            investment_category_field = None
+    # Releases don't depend on the field lookup: fetch them in the background
+    # (fetch_releases prints nothing, so nothing interleaves with the field
+    # discovery output; its message is shown once the releases are needed)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        releases_future = executor.submit(fetch_releases, jira, project_key)
+        
+        # Get the Investment Category field ID
+        try:
+            investment_category_field = get_investment_category_field_id(jira, project_key)
+        except ValueError as e:
+            print(f"\n⚠️  {str(e)}")
+            manual_field = prompt("\nDo you know the custom field ID? Enter it (e.g., customfield_10001) or press Enter to skip: ")
+            if manual_field:
+                investment_category_field = manual_field
+                print(f"✓ Using custom field: {investment_category_field}")
+            else:
+                print("⚠️  Continuing without custom field ID (will find releases only)")
+                investment_category_field = None
+        
+        releases, releases_message = releases_future.result()
+    print(releases_message)
     
     # Find qualifying releases
-    qualifying_releases = find_qualifying_releases(jira, project_key)
+    qualifying_releases = find_qualifying_releases(jira, project_key, releases=releases, verbose=True)
     
     # Print summary
     print(f"\n{'='*60}")
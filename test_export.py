@@ -2,25 +2,64 @@
 import sys
 sys.path.insert(0, 'sources')
 
+import json
+
 from jira_client import JiraClient
 from initiative_exporter import export_initiatives_to_json
 
-# Connect to Jira
-jira = JiraClient.from_env()
-print(f"✓ Connected to Jira")
-
-# Export initiatives
-output_file = export_initiatives_to_json(jira, 'PMT')
-print(f"\n✓ Export complete: {output_file}")
-
-# Show a sample record
-if output_file:
-    import json
-    with open(output_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        # Find an initiative with linked issues
-        for item in data:
-            if item.get('linkedIssuesCount', 0) > 0:
-                print(f"\nSample Initiative with linked issues:")
-                print(json.dumps(item, indent=2))
+
+def iter_json_array(f, chunk_size=65536):
+    """Yield the items of a JSON array file one at a time, without loading the whole file."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    opened = False
+    while True:
+        chunk = f.read(chunk_size)
+        buffer += chunk
+        while True:
+            buffer = buffer.lstrip()
+            if not opened:
+                if not buffer:
+                    break
+                if buffer[0] != '[':
+                    raise ValueError("Expected a JSON array")
+                buffer = buffer[1:]
+                opened = True
+            elif buffer[:1] == ',':
+                buffer = buffer[1:]
+            elif buffer[:1] == ']':
+                return
+            elif buffer:
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    if not chunk:
+                        raise
+                    # Record continues in the next chunk
+                    break
+                yield item
+                buffer = buffer[end:]
+            else:
                 break
+        if not chunk:
+            raise ValueError("Unterminated JSON array")
+
+
+if __name__ == '__main__':
+    # Connect to Jira
+    jira = JiraClient.from_env()
+    print(f"✓ Connected to Jira")
+
+    # Export initiatives
+    output_file = export_initiatives_to_json(jira, 'PMT')
+    print(f"\n✓ Export complete: {output_file}")
+
+    # Show a sample record
+    if output_file:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            # Stream records and stop at the first initiative with linked issues
+            for item in iter_json_array(f):
+                if item.get('linkedIssuesCount', 0) > 0:
+                    print(f"\nSample Initiative with linked issues:")
+                    print(json.dumps(item, indent=2))
+                    break